@@ -6,7 +6,38 @@ portfolio data through Django's admin panel.
 """
 
 from django.contrib import admin
-from .models import Skill, Project, Experience, Education, Contact, About
+from django.db.models import F, Q
+from django.utils import timezone
+from .cache import invalidate_on_commit
+from .models import Skill, Technology, Project, Experience, Education, Contact, About
+from .pagination import CachingPaginator
+from .search import (
+    PROJECT_SEARCH_FIELDS, EXPERIENCE_SEARCH_FIELDS, annotate_search_vector,
+    full_text_search, full_text_search_supported, search_query, tagged_project_ids
+)
+
+
+def _toggle_field(modeladmin, request, queryset, field_name):
+    """Flip a boolean field on all selected rows with a single UPDATE."""
+    updated = queryset.update(**{field_name: ~F(field_name), 'updated_at': timezone.now()})
+    # QuerySet.update() does not send post_save, so invalidate explicitly
+    invalidate_on_commit(queryset.model, using=queryset.db)
+    modeladmin.message_user(request, f"Updated {updated} item(s).")
+
+
+@admin.action(description='Toggle featured status')
+def toggle_featured(modeladmin, request, queryset):
+    _toggle_field(modeladmin, request, queryset, 'is_featured')
+
+
+@admin.action(description='Toggle published status')
+def toggle_published(modeladmin, request, queryset):
+    _toggle_field(modeladmin, request, queryset, 'is_published')
+
+
+@admin.action(description='Toggle current status')
+def toggle_current(modeladmin, request, queryset):
+    _toggle_field(modeladmin, request, queryset, 'is_current')
 
 
 @admin.register(Skill)
@@ -21,8 +52,10 @@ class SkillAdmin(admin.ModelAdmin):
     list_display = ['name', 'category', 'proficiency_level', 'years_experience', 'is_featured', 'created_at']
     list_filter = ['category', 'is_featured', 'proficiency_level', 'created_at']
     search_fields = ['name', 'category']
-    list_editable = ['is_featured', 'proficiency_level']
+    actions = [toggle_featured]
     ordering = ['-proficiency_level', 'name']
+    paginator = CachingPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
@@ -40,6 +73,20 @@ class SkillAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
 
 
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for Technology model.
+    
+    Provides a simple interface for managing the technologies
+    that can be attached to projects.
+    """
+    
+    list_display = ['name']
+    search_fields = ['name']
+    ordering = ['name']
+
+
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     """
@@ -50,10 +97,13 @@ class ProjectAdmin(admin.ModelAdmin):
     """
     
     list_display = ['title', 'is_featured', 'is_published', 'start_date', 'end_date', 'created_at']
-    list_filter = ['is_featured', 'is_published', 'start_date', 'created_at']
-    search_fields = ['title', 'description', 'technologies']
-    list_editable = ['is_featured', 'is_published']
+    list_filter = ['is_featured', 'is_published', 'technologies', 'start_date', 'created_at']
+    search_fields = ['title', 'description', 'technologies__name']
+    actions = [toggle_featured, toggle_published]
     ordering = ['-is_featured', '-start_date']
+    paginator = CachingPaginator
+    show_full_result_count = False
+    filter_horizontal = ['technologies']
     
     fieldsets = (
         ('Basic Information', {
@@ -75,6 +125,20 @@ class ProjectAdmin(admin.ModelAdmin):
     )
     
     readonly_fields = ['created_at', 'updated_at']
+    
+    def get_queryset(self, request):
+        """Defer the description column, which the changelist never displays."""
+        return super().get_queryset(request).defer('description')
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Use indexed full-text search, or a technology tag match, on PostgreSQL."""
+        if search_term and full_text_search_supported():
+            queryset = annotate_search_vector(queryset, PROJECT_SEARCH_FIELDS).filter(
+                Q(search_vector=search_query(search_term)) |
+                Q(id__in=tagged_project_ids(search_term))
+            )
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
 
 
 @admin.register(Experience)
@@ -89,8 +153,10 @@ class ExperienceAdmin(admin.ModelAdmin):
     list_display = ['position', 'company', 'is_current', 'start_date', 'end_date', 'location']
     list_filter = ['is_current', 'start_date', 'company']
     search_fields = ['position', 'company', 'description', 'location']
-    list_editable = ['is_current']
+    actions = [toggle_current]
     ordering = ['-is_current', '-start_date']
+    paginator = CachingPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Position Details', {
@@ -109,6 +175,16 @@ class ExperienceAdmin(admin.ModelAdmin):
     )
     
     readonly_fields = ['created_at', 'updated_at']
+    
+    def get_queryset(self, request):
+        """Defer the description column, which the changelist never displays."""
+        return super().get_queryset(request).defer('description')
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Use indexed full-text search on PostgreSQL."""
+        if search_term and full_text_search_supported():
+            return full_text_search(queryset, EXPERIENCE_SEARCH_FIELDS, search_term), False
+        return super().get_search_results(request, queryset, search_term)
 
 
 @admin.register(Education)
@@ -123,8 +199,10 @@ class EducationAdmin(admin.ModelAdmin):
     list_display = ['degree', 'institution', 'field_of_study', 'is_current', 'gpa', 'location']
     list_filter = ['is_current', 'institution', 'field_of_study']
     search_fields = ['degree', 'institution', 'field_of_study', 'location']
-    list_editable = ['is_current']
+    actions = [toggle_current]
     ordering = ['-is_current', '-end_date']
+    paginator = CachingPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Academic Information', {
@@ -163,12 +241,12 @@ class ContactAdmin(admin.ModelAdmin):
             'fields': ('linkedin_url', 'github_url', 'twitter_url', 'website_url', 'resume_url')
         }),
         ('Timestamps', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('created_at',),
             'classes': ('collapse',)
         }),
     )
     
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['created_at']
 
 
 @admin.register(About)
@@ -192,12 +270,16 @@ class AboutAdmin(admin.ModelAdmin):
             'fields': ('profile_image', 'resume_file')
         }),
         ('Timestamps', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('created_at',),
             'classes': ('collapse',)
         }),
     )
     
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['created_at']
+    
+    def get_queryset(self, request):
+        """Defer the bio column, which the changelist never displays."""
+        return super().get_queryset(request).defer('bio')
 
 
 # Customize admin site header and title
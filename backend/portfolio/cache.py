@@ -0,0 +1,61 @@
+"""
+Cache helpers for portfolio API responses.
+
+This module centralizes the cache keys used by the portfolio views and
+provides invalidation helpers that are triggered whenever portfolio
+data changes.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+# Portfolio summary data with its ETag and Last-Modified time
+SUMMARY_CACHE_KEY = 'portfolio:summary:v2'
+SUMMARY_CACHE_TIMEOUT = 60 * 15
+
+# Aggregate counts returned by the portfolio stats endpoint
+STATS_CACHE_KEY = 'portfolio:stats:v1'
+STATS_CACHE_TIMEOUT = 60 * 15
+
+# Row counts used by paginated list views
+COUNT_CACHE_TIMEOUT = 60 * 5
+
+
+def count_version_key(model):
+    """Build the cache key holding the count version of a model."""
+    return f'portfolio:count:{model._meta.label_lower}:version'
+
+
+def count_cache_key(queryset):
+    """Build a cache key for the row count of a queryset's SQL."""
+    sql = str(queryset.query).encode()
+    # Seed new versions with a timestamp so they never reuse an evicted one
+    version = cache.get_or_set(count_version_key(queryset.model), time.time_ns, None)
+    return f'portfolio:count:{version}:{hashlib.md5(sql).hexdigest()}'
+
+
+def invalidate_counts(*models):
+    """Expire the cached row counts of the given models."""
+    for model in models:
+        try:
+            cache.incr(count_version_key(model))
+        except ValueError:
+            # No counts have been cached for this model yet
+            pass
+
+
+def invalidate_portfolio_cache():
+    """Remove all cached portfolio responses."""
+    cache.delete_many([SUMMARY_CACHE_KEY, STATS_CACHE_KEY])
+
+
+def invalidate_on_commit(*models, using=None):
+    """Invalidate cached portfolio responses once the current transaction commits."""
+    def invalidate():
+        invalidate_portfolio_cache()
+        invalidate_counts(*models)
+    
+    transaction.on_commit(invalidate, using=using)
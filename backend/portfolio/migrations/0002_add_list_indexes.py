@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['-proficiency_level', 'name'], name='skill_proficiency_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', 'is_featured'], name='skill_category_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-is_featured', '-start_date'], name='project_featured_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_published', 'is_featured'], name='project_published_feat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-is_current', '-start_date'], name='experience_current_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-is_current', '-end_date'], name='education_current_end_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-15 09:30
+
+from django.db import migrations
+
+SEARCH_INDEXES = [
+    ('Project', 'project_search_idx', ('title', 'description', 'technologies')),
+    ('Experience', 'experience_search_idx', ('position', 'company', 'description', 'location')),
+]
+
+
+def _search_indexes(apps):
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+    
+    for model_name, index_name, fields in SEARCH_INDEXES:
+        model = apps.get_model('portfolio', model_name)
+        index = GinIndex(SearchVector(*fields, config='english'), name=index_name)
+        yield model, index
+
+
+def add_search_indexes(apps, schema_editor):
+    """Create functional GIN indexes for full-text search (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model, index in _search_indexes(apps):
+        schema_editor.add_index(model, index)
+
+
+def remove_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model, index in _search_indexes(apps):
+        schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0002_add_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_indexes, remove_search_indexes),
+    ]
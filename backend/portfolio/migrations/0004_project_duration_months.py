@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+def populate_duration_months(apps, schema_editor):
+    Project = apps.get_model('portfolio', 'Project')
+    projects = list(Project.objects.filter(end_date__isnull=False))
+    for project in projects:
+        project.duration_months = round((project.end_date - project.start_date).days / 30, 1)
+    Project.objects.bulk_update(projects, ['duration_months'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_add_full_text_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='duration_months',
+            field=models.FloatField(blank=True, editable=False, help_text='Duration in months, stored when the project is completed', null=True),
+        ),
+        migrations.RunPython(populate_duration_months, migrations.RunPython.noop),
+    ]
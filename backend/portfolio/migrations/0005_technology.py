@@ -0,0 +1,103 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:30
+
+from django.db import migrations, models
+
+
+def split_technologies(apps, schema_editor):
+    """Create Technology rows from the comma-separated project technologies."""
+    Technology = apps.get_model('portfolio', 'Technology')
+    Project = apps.get_model('portfolio', 'Project')
+    
+    for project in Project.objects.all():
+        names = {name.strip() for name in project.technologies_csv.split(',') if name.strip()}
+        for name in names:
+            technology, _ = Technology.objects.get_or_create(name=name)
+            project.technologies.add(technology)
+
+
+def join_technologies(apps, schema_editor):
+    """Rebuild the comma-separated technologies from Technology rows."""
+    Project = apps.get_model('portfolio', 'Project')
+    
+    for project in Project.objects.prefetch_related('technologies'):
+        project.technologies_csv = ', '.join(t.name for t in project.technologies.all())
+        project.save(update_fields=['technologies_csv'])
+
+
+def _project_search_index(*fields):
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+    
+    return GinIndex(SearchVector(*fields, config='english'), name='project_search_idx')
+
+
+def add_project_search_index(apps, schema_editor):
+    """
+    Recreate the project search index without the technologies column
+    (PostgreSQL only). Dropping the column also drops the old index.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    project = apps.get_model('portfolio', 'Project')
+    schema_editor.add_index(project, _project_search_index('title', 'description'))
+
+
+def remove_project_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    project = apps.get_model('portfolio', 'Project')
+    schema_editor.remove_index(project, _project_search_index('title', 'description'))
+
+
+def restore_legacy_search_index(apps, schema_editor):
+    """Recreate the 0003 search index when unapplying (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    project = apps.get_model('portfolio', 'Project')
+    schema_editor.add_index(project, _project_search_index('title', 'description', 'technologies'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0004_project_duration_months'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Technology',
+                'verbose_name_plural': 'Technologies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RunPython(migrations.RunPython.noop, restore_legacy_search_index),
+        migrations.RenameField(
+            model_name='project',
+            old_name='technologies',
+            new_name='technologies_csv',
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='technologies',
+            field=models.ManyToManyField(blank=True, related_name='projects', to='portfolio.technology'),
+        ),
+        migrations.RunPython(split_technologies, join_technologies),
+        # Give the column a default so unapplying can re-add it to existing rows;
+        # join_technologies then rebuilds the values
+        migrations.AlterField(
+            model_name='project',
+            name='technologies_csv',
+            field=models.CharField(default='', help_text='Comma-separated list of technologies', max_length=500),
+        ),
+        migrations.RemoveField(
+            model_name='project',
+            name='technologies_csv',
+        ),
+        migrations.RunPython(add_project_search_index, remove_project_search_index),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_technology'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='github_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='live_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='experience',
+            name='company_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='linkedin_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='github_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='twitter_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='website_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='resume_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0006_remove_duplicate_url_validators'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['title'], name='project_title_pat_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['company'], name='experience_company_pat_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['position'], name='experience_position_pat_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['institution'], name='education_institution_pat_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+def populate_file_urls(apps, schema_editor):
+    Project = apps.get_model('portfolio', 'Project')
+    About = apps.get_model('portfolio', 'About')
+    
+    for project in Project.objects.all():
+        project.image_url = project.image.url if project.image else ''
+        project.save(update_fields=['image_url'])
+    
+    for about in About.objects.all():
+        about.profile_image_url = about.profile_image.url if about.profile_image else ''
+        about.resume_file_url = about.resume_file.url if about.resume_file else ''
+        about.save(update_fields=['profile_image_url', 'resume_file_url'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0007_add_pattern_ops_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='image_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='about',
+            name='profile_image_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='about',
+            name='resume_file_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.RunPython(populate_file_urls, migrations.RunPython.noop),
+    ]
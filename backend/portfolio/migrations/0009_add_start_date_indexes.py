@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0008_stored_file_urls'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-start_date', '-id'], name='project_start_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-start_date', '-id'], name='experience_start_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-start_date', '-id'], name='education_start_date_idx'),
+        ),
+    ]
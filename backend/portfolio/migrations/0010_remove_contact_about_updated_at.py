@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 13:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0009_add_start_date_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='contact',
+            name='updated_at',
+        ),
+        migrations.RemoveField(
+            model_name='about',
+            name='updated_at',
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 13:30
+
+from django.db import migrations
+import portfolio.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0010_remove_contact_about_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='image',
+            field=portfolio.models.HashedImageField(blank=True, null=True, upload_to='projects'),
+        ),
+        migrations.AlterField(
+            model_name='about',
+            name='profile_image',
+            field=portfolio.models.HashedImageField(blank=True, null=True, upload_to='profile'),
+        ),
+        migrations.AlterField(
+            model_name='about',
+            name='resume_file',
+            field=portfolio.models.HashedFileField(blank=True, null=True, upload_to='resume'),
+        ),
+    ]
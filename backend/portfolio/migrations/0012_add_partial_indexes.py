@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0011_hashed_upload_paths'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-proficiency_level', 'name'], name='skill_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_featured', True), ('is_published', True)), fields=['-start_date'], name='project_featured_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('is_current', True)), fields=['-start_date', '-id'], name='experience_current_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(condition=models.Q(('is_current', True)), fields=['-start_date', '-id'], name='education_current_idx'),
+        ),
+    ]
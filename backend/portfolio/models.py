@@ -5,10 +5,121 @@ This module contains Django models for managing portfolio information including
 projects, skills, experience, education, and contact details.
 """
 
-from django.db import models
-from django.core.validators import URLValidator, MinValueValidator, MaxValueValidator
+import hashlib
+import posixpath
+
+from django.core.cache import cache
+from django.core.files.base import File
+from django.db import models, router, transaction
+from django.db.models.fields.files import FieldFile, ImageFieldFile
+from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
+# Cache default distinguishing a missing key from a cached None
+_MISSING = object()
+
+
+class ContentHashedFileMixin:
+    """
+    FieldFile mixin that stores files under a hash of their content.
+    
+    The hash is taken from the content being saved, so a file with new
+    content always gets a new URL and uploaded media can be served with
+    long-lived, immutable cache headers. This covers both assigning a
+    file to the field and calling ``FieldFile.save()`` directly, since
+    model saves commit assigned files through ``save()`` as well.
+    """
+    
+    def save(self, name, content, save=True):
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        
+        hasher = hashlib.sha1()
+        for chunk in content.chunks():
+            hasher.update(chunk)
+        name = posixpath.join(hasher.hexdigest()[:16], posixpath.basename(name))
+        super().save(name, content, save)
+
+
+class ContentHashedFieldFile(ContentHashedFileMixin, FieldFile):
+    """Content-hashed FieldFile for HashedFileField."""
+
+
+class ContentHashedImageFieldFile(ContentHashedFileMixin, ImageFieldFile):
+    """Content-hashed ImageFieldFile for HashedImageField."""
+
+
+class HashedFileField(models.FileField):
+    """File field storing uploads under ``<upload_to>/<content hash>/``."""
+    
+    attr_class = ContentHashedFieldFile
+
+
+class HashedImageField(models.ImageField):
+    """Image field storing uploads under ``<upload_to>/<content hash>/``."""
+    
+    attr_class = ContentHashedImageFieldFile
+
+
+class CachedSingletonMixin:
+    """
+    Mixin for models that hold a single logical row.
+    
+    The first row is cached so repeated lookups skip the database, and
+    an empty table is cached too. SINGLETON_DEFERRED_FIELDS lists columns
+    that readers of the cached row never use, so they are not loaded.
+    Signal handlers clear the cached row whenever the model changes.
+    """
+    
+    SINGLETON_CACHE_TIMEOUT = 60 * 60
+    SINGLETON_DEFERRED_FIELDS = ()
+    
+    @classmethod
+    def singleton_cache_key(cls):
+        """Get the cache key for the singleton row."""
+        return f'portfolio:{cls.__name__.lower()}:singleton'
+    
+    @classmethod
+    def get_cached(cls):
+        """Get the singleton row from the cache, loading it if needed."""
+        key = cls.singleton_cache_key()
+        obj = cache.get(key, _MISSING)
+        if obj is _MISSING:
+            obj = cls.objects.defer(*cls.SINGLETON_DEFERRED_FIELDS).first()
+            cache.set(key, obj, cls.SINGLETON_CACHE_TIMEOUT)
+        return obj
+
+
+class StoredFileURLMixin:
+    """
+    Mixin that stores the URLs of file fields in plain columns.
+    
+    FILE_URL_FIELDS maps each file field to the column holding its URL.
+    URLs are resolved once on save, so responses don't call the storage
+    backend for every file on every request.
+    """
+    
+    FILE_URL_FIELDS = {}
+    
+    def save(self, *args, **kwargs):
+        # Store the URLs in the same transaction as the row, so the cache
+        # invalidation run on commit never sees the row without them
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            
+            # File names are only final once the files have been committed
+            updates = {}
+            for file_field, url_field in self.FILE_URL_FIELDS.items():
+                file = getattr(self, file_field)
+                url = file.url if file else ''
+                if url != getattr(self, url_field):
+                    setattr(self, url_field, url)
+                    updates[url_field] = url
+            
+            if updates:
+                type(self).objects.filter(pk=self.pk).update(**updates)
+
 
 class Skill(models.Model):
     """
@@ -33,6 +144,7 @@ class Skill(models.Model):
         ('design', 'Design Tool'),
         ('other', 'Other'),
     ]
+    CATEGORY_LABELS = dict(CATEGORY_CHOICES)
     
     name = models.CharField(max_length=100, unique=True)
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, default='other')
@@ -52,12 +164,39 @@ class Skill(models.Model):
         ordering = ['-proficiency_level', 'name']
         verbose_name = 'Skill'
         verbose_name_plural = 'Skills'
+        indexes = [
+            models.Index(fields=['-proficiency_level', 'name'], name='skill_proficiency_name_idx'),
+            models.Index(fields=['category', 'is_featured'], name='skill_category_featured_idx'),
+            models.Index(
+                fields=['-proficiency_level', 'name'], name='skill_featured_idx',
+                condition=models.Q(is_featured=True)
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.get_category_display()})"
 
 
-class Project(models.Model):
+class Technology(models.Model):
+    """
+    Model representing a technology used in projects.
+    
+    Attributes:
+        name (str): The name of the technology (e.g., 'Django', 'React')
+    """
+    
+    name = models.CharField(max_length=100, unique=True)
+    
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Technology'
+        verbose_name_plural = 'Technologies'
+    
+    def __str__(self):
+        return self.name
+
+
+class Project(StoredFileURLMixin, models.Model):
     """
     Model representing a portfolio project.
     
@@ -65,14 +204,16 @@ class Project(models.Model):
         title (str): Project title
         description (str): Detailed project description
         short_description (str): Brief summary for cards
-        technologies (str): Comma-separated list of technologies used
+        technologies (ManyToManyField): Technologies used in the project
         github_url (str): GitHub repository URL
         live_url (str): Live demo URL
         image (ImageField): Project screenshot
+        image_url (str): Stored URL of the project screenshot
         is_featured (bool): Whether to display prominently
         is_published (bool): Whether to show on public portfolio
         start_date (date): Project start date
         end_date (date): Project completion date (null if ongoing)
+        duration_months (float): Stored duration of completed projects
         created_at (datetime): When the project was added
         updated_at (datetime): When the project was last modified
     """
@@ -80,14 +221,21 @@ class Project(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     short_description = models.CharField(max_length=300)
-    technologies = models.CharField(max_length=500, help_text="Comma-separated list of technologies")
-    github_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
-    live_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
-    image = models.ImageField(upload_to='projects/', blank=True, null=True)
+    technologies = models.ManyToManyField(Technology, related_name='projects', blank=True)
+    github_url = models.URLField(blank=True, null=True)
+    live_url = models.URLField(blank=True, null=True)
+    image = HashedImageField(upload_to='projects', blank=True, null=True)
+    image_url = models.CharField(max_length=500, blank=True, editable=False)
     is_featured = models.BooleanField(default=False)
     is_published = models.BooleanField(default=True)
     start_date = models.DateField()
     end_date = models.DateField(blank=True, null=True)
+    duration_months = models.FloatField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Duration in months, stored when the project is completed"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -95,19 +243,48 @@ class Project(models.Model):
         ordering = ['-is_featured', '-start_date']
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
+        indexes = [
+            models.Index(fields=['-is_featured', '-start_date'], name='project_featured_start_idx'),
+            models.Index(fields=['is_published', 'is_featured'], name='project_published_feat_idx'),
+            models.Index(fields=['title'], name='project_title_pat_idx', opclasses=['varchar_pattern_ops']),
+            models.Index(fields=['-start_date', '-id'], name='project_start_date_idx'),
+            models.Index(
+                fields=['-start_date'], name='project_featured_pub_idx',
+                condition=models.Q(is_featured=True, is_published=True)
+            ),
+        ]
+    
+    FILE_URL_FIELDS = {'image': 'image_url'}
     
     def __str__(self):
         return self.title
     
-    @property
-    def duration(self):
-        """Calculate project duration in months."""
+    def save(self, *args, **kwargs):
+        """Store the duration of completed projects once, at write time."""
         if self.end_date:
-            delta = self.end_date - self.start_date
-            return round(delta.days / 30, 1)
+            self.duration_months = self.months_between(self.start_date, self.end_date)
         else:
-            delta = timezone.now().date() - self.start_date
-            return round(delta.days / 30, 1)
+            self.duration_months = None
+        
+        # Keep the stored duration in step with partial saves of the dates
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'start_date', 'end_date'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'duration_months'}
+        
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def months_between(start_date, end_date):
+        """Calculate the number of months between two dates."""
+        delta = end_date - start_date
+        return round(delta.days / 30, 1)
+    
+    @property
+    def duration(self):
+        """Project duration in months, computed live only for ongoing projects."""
+        if self.duration_months is not None:
+            return self.duration_months
+        return self.months_between(self.start_date, timezone.now().date())
 
 
 class Experience(models.Model):
@@ -134,7 +311,7 @@ class Experience(models.Model):
     end_date = models.DateField(blank=True, null=True)
     is_current = models.BooleanField(default=False)
     location = models.CharField(max_length=200)
-    company_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
+    company_url = models.URLField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -142,6 +319,16 @@ class Experience(models.Model):
         ordering = ['-is_current', '-start_date']
         verbose_name = 'Experience'
         verbose_name_plural = 'Experiences'
+        indexes = [
+            models.Index(fields=['-is_current', '-start_date'], name='experience_current_start_idx'),
+            models.Index(fields=['company'], name='experience_company_pat_idx', opclasses=['varchar_pattern_ops']),
+            models.Index(fields=['position'], name='experience_position_pat_idx', opclasses=['varchar_pattern_ops']),
+            models.Index(fields=['-start_date', '-id'], name='experience_start_date_idx'),
+            models.Index(
+                fields=['-start_date', '-id'], name='experience_current_idx',
+                condition=models.Q(is_current=True)
+            ),
+        ]
     
     def __str__(self):
         return f"{self.position} at {self.company}"
@@ -184,12 +371,21 @@ class Education(models.Model):
         ordering = ['-is_current', '-end_date']
         verbose_name = 'Education'
         verbose_name_plural = 'Education'
+        indexes = [
+            models.Index(fields=['-is_current', '-end_date'], name='education_current_end_idx'),
+            models.Index(fields=['institution'], name='education_institution_pat_idx', opclasses=['varchar_pattern_ops']),
+            models.Index(fields=['-start_date', '-id'], name='education_start_date_idx'),
+            models.Index(
+                fields=['-start_date', '-id'], name='education_current_idx',
+                condition=models.Q(is_current=True)
+            ),
+        ]
     
     def __str__(self):
         return f"{self.degree} in {self.field_of_study} from {self.institution}"
 
 
-class Contact(models.Model):
+class Contact(CachedSingletonMixin, models.Model):
     """
     Model representing contact information and social links.
     
@@ -203,19 +399,17 @@ class Contact(models.Model):
         website_url (str): Personal website URL
         resume_url (str): Resume/CV download URL
         created_at (datetime): When the contact info was added
-        updated_at (datetime): When the contact info was last modified
     """
     
     email = models.EmailField(unique=True)
     phone = models.CharField(max_length=20, blank=True)
     location = models.CharField(max_length=200)
-    linkedin_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
-    github_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
-    twitter_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
-    website_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
-    resume_url = models.URLField(blank=True, null=True, validators=[URLValidator()])
+    linkedin_url = models.URLField(blank=True, null=True)
+    github_url = models.URLField(blank=True, null=True)
+    twitter_url = models.URLField(blank=True, null=True)
+    website_url = models.URLField(blank=True, null=True)
+    resume_url = models.URLField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = 'Contact Information'
@@ -225,7 +419,7 @@ class Contact(models.Model):
         return f"Contact: {self.email}"
 
 
-class About(models.Model):
+class About(CachedSingletonMixin, StoredFileURLMixin, models.Model):
     """
     Model representing personal information and bio.
     
@@ -234,22 +428,31 @@ class About(models.Model):
         title (str): Professional title or tagline
         bio (str): Personal biography and introduction
         profile_image (ImageField): Profile picture
+        profile_image_url (str): Stored URL of the profile picture
         resume_file (FileField): Resume/CV file
+        resume_file_url (str): Stored URL of the resume/CV file
         created_at (datetime): When the about info was added
-        updated_at (datetime): When the about info was last modified
     """
     
     name = models.CharField(max_length=200)
     title = models.CharField(max_length=200)
     bio = models.TextField()
-    profile_image = models.ImageField(upload_to='profile/', blank=True, null=True)
-    resume_file = models.FileField(upload_to='resume/', blank=True, null=True)
+    profile_image = HashedImageField(upload_to='profile', blank=True, null=True)
+    profile_image_url = models.CharField(max_length=500, blank=True, editable=False)
+    resume_file = HashedFileField(upload_to='resume', blank=True, null=True)
+    resume_file_url = models.CharField(max_length=500, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         verbose_name = 'About Information'
         verbose_name_plural = 'About Information'
     
+    FILE_URL_FIELDS = {
+        'profile_image': 'profile_image_url',
+        'resume_file': 'resume_file_url',
+    }
+    # Responses only expose the stored file URLs
+    SINGLETON_DEFERRED_FIELDS = ('profile_image', 'resume_file')
+    
     def __str__(self):
         return f"About: {self.name}"
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Pagination classes for portfolio list views.
+
+This module contains paginators that avoid re-running expensive
+``COUNT(*)`` queries on every page request.
+"""
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from .cache import COUNT_CACHE_TIMEOUT, count_cache_key
+
+
+class CachingPaginator(Paginator):
+    """
+    Paginator that caches the total object count.
+    
+    Django admin changelists and page number API lists count the full
+    result set on every page load. The count is cached per query for a
+    few minutes, and expired whenever the model is written to, so paging
+    through a list, or returning to it, reuses the previous count.
+    """
+    
+    @cached_property
+    def count(self):
+        """Return the total number of objects, using the cache when possible."""
+        if not hasattr(self.object_list, 'query'):
+            return super().count
+        
+        try:
+            key = count_cache_key(self.object_list)
+        except EmptyResultSet:
+            return 0
+        
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class CachingPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination backed by CachingPaginator.
+    
+    The total count of each filtered list is cached until the model
+    is written to, so page requests only run the page query.
+    """
+    
+    django_paginator_class = CachingPaginator
+
+
+class StartDateCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by most recent start date.
+    
+    Pages are read with a keyset query on start_date, so list requests
+    skip the COUNT(*) that page-number pagination runs and cost the same
+    regardless of table size.
+    
+    Lists using it are ordered by start date only, not by the model's
+    Meta.ordering: current experience and education entries are not
+    moved to the front. A cursor needs a (nearly) unique leading column,
+    so a boolean such as is_current cannot lead the ordering; clients
+    that show current entries first sort them within the page.
+    """
+    
+    ordering = ('-start_date', '-id')
+    page_size = 20
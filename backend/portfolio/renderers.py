@@ -0,0 +1,31 @@
+"""
+Response renderers for the portfolio API.
+
+This module contains a JSON renderer backed by ``orjson``, which encodes
+responses considerably faster than the standard library ``json`` module.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer that serializes response data to JSON with orjson.
+    
+    Types orjson cannot encode natively (e.g. Decimal or lazy translation
+    strings) are converted with DRF's JSONEncoder, so responses match the
+    default JSONRenderer output.
+    """
+    
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into compact JSON bytes."""
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=JSONEncoder().default, option=self.options)
@@ -0,0 +1,58 @@
+"""
+Full-text search helpers for portfolio models.
+
+On PostgreSQL, text search runs against functional GIN indexes built from
+the same search vectors defined here. Other databases (e.g. the SQLite
+development database) fall back to Django's default ``icontains`` search.
+"""
+
+from django.db import connection
+from .models import Project
+
+SEARCH_CONFIG = 'english'
+
+PROJECT_SEARCH_FIELDS = ('title', 'description')
+EXPERIENCE_SEARCH_FIELDS = ('position', 'company', 'description', 'location')
+
+
+def full_text_search_supported():
+    """Return True when the database supports indexed full-text search."""
+    return connection.vendor == 'postgresql'
+
+
+def annotate_search_vector(queryset, fields):
+    """
+    Annotate a queryset with the search vector of the given fields.
+    
+    The vector matches the functional GIN index for the same fields, so
+    filtering on the annotation is resolved from the index instead of
+    scanning rows.
+    """
+    from django.contrib.postgres.search import SearchVector
+    
+    return queryset.annotate(search_vector=SearchVector(*fields, config=SEARCH_CONFIG))
+
+
+def search_query(term):
+    """Build a PostgreSQL full-text query from user input."""
+    from django.contrib.postgres.search import SearchQuery
+    
+    return SearchQuery(term, config=SEARCH_CONFIG, search_type='websearch')
+
+
+def full_text_search(queryset, fields, term):
+    """Filter a queryset with a PostgreSQL full-text query."""
+    return annotate_search_vector(queryset, fields).filter(search_vector=search_query(term))
+
+
+def tagged_project_ids(name):
+    """
+    Get a subquery of the ids of projects tagged with a technology name.
+    
+    The lookup runs on the project/technology link table, so filtering
+    with ``id__in`` needs no join and no DISTINCT. Names match exactly,
+    which the unique index on the technology name can serve.
+    """
+    return Project.technologies.through.objects.filter(
+        technology__name=name
+    ).values('project_id')
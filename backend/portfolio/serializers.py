@@ -5,19 +5,115 @@ This module contains serializers for converting Django model instances
 to JSON format and handling API request/response data validation.
 """
 
+from django.db import transaction
 from rest_framework import serializers
-from .models import Skill, Project, Experience, Education, Contact, About
+from rest_framework.utils import model_meta
+from .models import Skill, Technology, Project, Experience, Education, Contact, About
 
 
-class SkillSerializer(serializers.ModelSerializer):
+class DateRangeValidator:
     """
-    Serializer for Skill model.
+    Validator for serializers with start and end dates.
     
-    Provides serialization for skill data including validation
-    and custom field representations.
+    Ensures the end date is not before the start date and, when
+    current_message is given, that current entries have no end date.
     """
     
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    def __init__(self, current_message=None):
+        self.current_message = current_message
+    
+    def __call__(self, attrs):
+        start_date = attrs.get('start_date')
+        end_date = attrs.get('end_date')
+        
+        if self.current_message and end_date and attrs.get('is_current', False):
+            raise serializers.ValidationError(self.current_message)
+        
+        if end_date and start_date and end_date < start_date:
+            raise serializers.ValidationError("End date cannot be before start date.")
+
+
+class PartialUpdateMixin:
+    """
+    Mixin for model serializers that saves only submitted columns.
+    
+    Partial updates (PATCH) save the instance with update_fields set to
+    the submitted fields plus any auto_now timestamps, so the UPDATE
+    statement only touches the columns that changed.
+    """
+    
+    def update(self, instance, validated_data):
+        if not self.partial:
+            return super().update(instance, validated_data)
+        
+        serializers.raise_errors_on_nested_writes('update', self, validated_data)
+        info = model_meta.get_field_info(instance)
+        
+        many_to_many = {}
+        update_fields = [
+            field.name for field in instance._meta.concrete_fields
+            if getattr(field, 'auto_now', False)
+        ]
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                many_to_many[attr] = value
+            else:
+                setattr(instance, attr, value)
+                update_fields.append(attr)
+        
+        instance.save(update_fields=update_fields)
+        
+        for attr, value in many_to_many.items():
+            getattr(instance, attr).set(value)
+        
+        return instance
+
+
+class EagerLoadingMixin:
+    """
+    Mixin for model serializers that derives eager loading from their fields.
+    
+    Readable related fields are collected once per serializer class:
+    single relations are loaded with select_related and to-many relations
+    with prefetch_related, so views never issue one query per row.
+    """
+    
+    @classmethod
+    def eager_relations(cls):
+        """Get the (select_related, prefetch_related) lookups for this serializer."""
+        if '_eager_relations' not in cls.__dict__:
+            select_related, prefetch_related = [], []
+            for field in cls().fields.values():
+                if field.write_only or field.source == '*':
+                    continue
+                lookup = field.source.replace('.', '__')
+                if isinstance(field, (serializers.ManyRelatedField, serializers.ListSerializer)):
+                    prefetch_related.append(lookup)
+                elif isinstance(field, (serializers.RelatedField, serializers.BaseSerializer)):
+                    select_related.append(lookup)
+            cls._eager_relations = (tuple(select_related), tuple(prefetch_related))
+        return cls._eager_relations
+    
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Eager-load the relations read by this serializer."""
+        select_related, prefetch_related = cls.eager_relations()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+
+class SkillReadSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    """
+    Read-only serializer for Skill model.
+    
+    Used for safe requests; all fields are read-only so no
+    write-side field validators are built for each skill.
+    """
+    
+    category_display = serializers.SerializerMethodField()
     
     class Meta:
         model = Skill
@@ -26,6 +122,22 @@ class SkillSerializer(serializers.ModelSerializer):
             'proficiency_level', 'years_experience', 'is_featured',
             'created_at', 'updated_at'
         ]
+        read_only_fields = fields
+    
+    def get_category_display(self, obj):
+        """Get the human-readable category label."""
+        return Skill.CATEGORY_LABELS.get(obj.category, obj.category)
+
+
+class SkillWriteSerializer(PartialUpdateMixin, SkillReadSerializer):
+    """
+    Serializer for creating and updating skills.
+    
+    Provides validation for proficiency level and years
+    of experience.
+    """
+    
+    class Meta(SkillReadSerializer.Meta):
         read_only_fields = ['id', 'created_at', 'updated_at']
     
     def validate_proficiency_level(self, value):
@@ -41,45 +153,119 @@ class SkillSerializer(serializers.ModelSerializer):
         return value
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class MediaURLField(serializers.ReadOnlyField):
+    """
+    Read-only field for a stored media URL.
+    
+    Stored URLs are relative to the site (e.g. ``/media/...``); they are
+    returned as absolute URLs when the request is available, so clients
+    on another origin can load them.
+    """
+    
+    def to_representation(self, value):
+        request = self.context.get('request')
+        if value and request is not None:
+            return request.build_absolute_uri(value)
+        return value
+
+
+class TechnologyNameField(serializers.SlugRelatedField):
+    """
+    Related field representing technologies by name.
+    
+    Validation only normalizes the submitted names; unknown technologies
+    are created by the serializer's save, so clients can submit plain
+    lists of names without failed requests leaving rows behind.
+    """
+    
+    default_error_messages = {
+        'max_length': 'Ensure this value has at most {max_length} characters.',
+    }
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('slug_field', 'name')
+        kwargs.setdefault('queryset', Technology.objects.all())
+        super().__init__(**kwargs)
+    
+    def to_internal_value(self, data):
+        if not isinstance(data, str) or not data.strip():
+            self.fail('invalid')
+        name = data.strip()
+        max_length = Technology._meta.get_field('name').max_length
+        if len(name) > max_length:
+            self.fail('max_length', max_length=max_length)
+        return name
+    
+    def resolve(self, names):
+        """Get the Technology rows for validated names, creating missing ones."""
+        queryset = self.get_queryset()
+        technologies = queryset.in_bulk(names, field_name='name')
+        for name in names:
+            if name not in technologies:
+                technologies[name], _ = queryset.get_or_create(name=name)
+        return [technologies[name] for name in dict.fromkeys(names)]
+
+
+class ProjectSerializer(PartialUpdateMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """
     Serializer for Project model.
     
     Provides serialization for project data including computed
-    duration field and technology list processing.
+    duration field and technology names. The uploaded image is
+    write-only; responses return its stored URL.
     """
     
     duration = serializers.ReadOnlyField()
-    technologies_list = serializers.SerializerMethodField()
+    technologies = TechnologyNameField(many=True, required=False)
+    image_url = MediaURLField()
     
     class Meta:
         model = Project
         fields = [
             'id', 'title', 'description', 'short_description',
-            'technologies', 'technologies_list', 'github_url', 'live_url',
-            'image', 'is_featured', 'is_published', 'start_date',
+            'technologies', 'github_url', 'live_url',
+            'image', 'image_url', 'is_featured', 'is_published', 'start_date',
             'end_date', 'duration', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'duration', 'created_at', 'updated_at']
+        extra_kwargs = {'image': {'write_only': True}}
+        validators = [DateRangeValidator()]
     
-    def get_technologies_list(self, obj):
-        """Convert comma-separated technologies string to list."""
-        if obj.technologies:
-            return [tech.strip() for tech in obj.technologies.split(',')]
-        return []
+    def create(self, validated_data):
+        with transaction.atomic():
+            self._resolve_technologies(validated_data)
+            return super().create(validated_data)
     
-    def validate(self, data):
-        """Validate project data consistency."""
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        
-        if end_date and start_date and end_date < start_date:
-            raise serializers.ValidationError("End date cannot be before start date.")
-        
-        return data
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            self._resolve_technologies(validated_data)
+            return super().update(instance, validated_data)
+    
+    def _resolve_technologies(self, validated_data):
+        """Replace validated technology names with Technology rows."""
+        if 'technologies' in validated_data:
+            field = self.fields['technologies'].child_relation
+            validated_data['technologies'] = field.resolve(validated_data['technologies'])
 
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(ProjectSerializer):
+    """
+    Serializer for project list responses.
+    
+    Omits the full description so list endpoints only load
+    the fields needed for project cards.
+    """
+    
+    class Meta(ProjectSerializer.Meta):
+        fields = [
+            'id', 'title', 'short_description',
+            'technologies', 'github_url', 'live_url',
+            'image_url', 'is_featured', 'is_published', 'start_date',
+            'end_date', 'duration', 'created_at', 'updated_at'
+        ]
+
+
+class ExperienceSerializer(PartialUpdateMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """
     Serializer for Experience model.
     
@@ -95,23 +281,27 @@ class ExperienceSerializer(serializers.ModelSerializer):
             'company_url', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        validators = [
+            DateRangeValidator(current_message="Current position cannot have an end date.")
+        ]
+
+
+class ExperienceListSerializer(ExperienceSerializer):
+    """
+    Serializer for experience list responses.
     
-    def validate(self, data):
-        """Validate experience data consistency."""
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        is_current = data.get('is_current', False)
-        
-        if is_current and end_date:
-            raise serializers.ValidationError("Current position cannot have an end date.")
-        
-        if end_date and start_date and end_date < start_date:
-            raise serializers.ValidationError("End date cannot be before start date.")
-        
-        return data
+    Omits the full job description from list endpoints.
+    """
+    
+    class Meta(ExperienceSerializer.Meta):
+        fields = [
+            'id', 'company', 'position',
+            'start_date', 'end_date', 'is_current', 'location',
+            'company_url', 'created_at', 'updated_at'
+        ]
 
 
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(PartialUpdateMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """
     Serializer for Education model.
     
@@ -127,29 +317,18 @@ class EducationSerializer(serializers.ModelSerializer):
             'location', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        validators = [
+            DateRangeValidator(current_message="Current education cannot have an end date.")
+        ]
     
     def validate_gpa(self, value):
         """Validate GPA is between 0.0 and 4.0."""
         if value is not None and not 0.0 <= value <= 4.0:
             raise serializers.ValidationError("GPA must be between 0.0 and 4.0.")
         return value
-    
-    def validate(self, data):
-        """Validate education data consistency."""
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        is_current = data.get('is_current', False)
-        
-        if is_current and end_date:
-            raise serializers.ValidationError("Current education cannot have an end date.")
-        
-        if end_date and start_date and end_date < start_date:
-            raise serializers.ValidationError("End date cannot be before start date.")
-        
-        return data
 
 
-class ContactSerializer(serializers.ModelSerializer):
+class ContactSerializer(PartialUpdateMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """
     Serializer for Contact model.
     
@@ -162,44 +341,32 @@ class ContactSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'email', 'phone', 'location',
             'linkedin_url', 'github_url', 'twitter_url',
-            'website_url', 'resume_url', 'created_at', 'updated_at'
+            'website_url', 'resume_url', 'created_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at']
 
 
-class AboutSerializer(serializers.ModelSerializer):
+class AboutSerializer(PartialUpdateMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """
     Serializer for About model.
     
     Provides serialization for personal information and bio.
+    Uploaded files are write-only; responses return their stored URLs.
     """
     
+    profile_image_url = MediaURLField()
+    resume_file_url = MediaURLField()
+    
     class Meta:
         model = About
         fields = [
             'id', 'name', 'title', 'bio',
-            'profile_image', 'resume_file', 'created_at', 'updated_at'
+            'profile_image', 'profile_image_url', 'resume_file',
+            'resume_file_url', 'created_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at']
+        extra_kwargs = {
+            'profile_image': {'write_only': True},
+            'resume_file': {'write_only': True},
+        }
 
-
-class PortfolioSummarySerializer(serializers.Serializer):
-    """
-    Serializer for portfolio summary data.
-    
-    Combines data from multiple models to provide
-    a comprehensive portfolio overview.
-    """
-    
-    about = AboutSerializer()
-    contact = ContactSerializer()
-    featured_skills = SkillSerializer(many=True)
-    featured_projects = ProjectSerializer(many=True)
-    recent_experience = ExperienceSerializer(many=True)
-    education = EducationSerializer(many=True)
-    
-    class Meta:
-        fields = [
-            'about', 'contact', 'featured_skills',
-            'featured_projects', 'recent_experience', 'education'
-        ]
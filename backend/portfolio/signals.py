@@ -0,0 +1,43 @@
+"""
+Signal handlers for portfolio models.
+
+This module keeps cached portfolio responses in sync with the database
+by invalidating them whenever portfolio data is saved or deleted.
+Invalidation runs once the write's transaction commits, so concurrent
+requests cannot re-cache rows that are about to change.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from .cache import invalidate_on_commit
+from .models import Skill, Technology, Project, Experience, Education, Contact, About
+
+PORTFOLIO_MODELS = (Skill, Technology, Project, Experience, Education, Contact, About)
+SINGLETON_MODELS = (Contact, About)
+
+
+def portfolio_data_changed(sender, using=None, **kwargs):
+    """Invalidate cached portfolio responses after a write."""
+    invalidate_on_commit(sender, using=using)
+
+
+def project_technologies_changed(sender, using=None, **kwargs):
+    """Invalidate cached portfolio responses after project technologies change."""
+    invalidate_on_commit(Project, Technology, using=using)
+
+
+def singleton_changed(sender, using=None, **kwargs):
+    """Clear the cached singleton row after a write."""
+    transaction.on_commit(lambda: cache.delete(sender.singleton_cache_key()), using=using)
+
+
+for model in PORTFOLIO_MODELS:
+    post_save.connect(portfolio_data_changed, sender=model)
+    post_delete.connect(portfolio_data_changed, sender=model)
+
+for model in SINGLETON_MODELS:
+    post_save.connect(singleton_changed, sender=model)
+    post_delete.connect(singleton_changed, sender=model)
+
+m2m_changed.connect(project_technologies_changed, sender=Project.technologies.through)
@@ -1,3 +1,481 @@
-from django.test import TestCase
+"""
+Tests for the portfolio API.
 
-# Create your tests here.
+These tests cover behaviour that is easy to break without noticing:
+stored media URLs, cache invalidation and query counts of the
+cached endpoints.
+"""
+
+import hashlib
+import shutil
+import tempfile
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import Value
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from .cache import SUMMARY_CACHE_KEY
+from .pagination import CachingPaginator
+from .models import Skill, Technology, Project, Experience, Education, Contact, About
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class PortfolioTestCase(TestCase):
+    """Base test case with an empty cache and a temporary media root."""
+    
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+    
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+
+class MediaURLTests(PortfolioTestCase):
+    """Stored file URLs are returned as absolute URLs."""
+    
+    def setUp(self):
+        super().setUp()
+        self.about = About.objects.create(
+            name='Jane', title='Developer', bio='Bio',
+            profile_image=ContentFile(b'image', name='me.png'),
+            resume_file=ContentFile(b'resume', name='cv.pdf')
+        )
+        self.project = Project.objects.create(
+            title='Site', description='Description', start_date=date(2024, 1, 1),
+            is_featured=True, image=ContentFile(b'shot', name='shot.png')
+        )
+    
+    def test_stored_urls_are_site_relative(self):
+        self.assertTrue(self.about.profile_image_url.startswith('/media/'))
+        self.assertTrue(self.project.image_url.startswith('/media/'))
+    
+    def test_about_returns_absolute_urls(self):
+        response = self.client.get('/api/about/')
+        about = response.json()['results'][0]
+        self.assertEqual(
+            about['profile_image_url'], f'http://testserver{self.about.profile_image_url}'
+        )
+        self.assertEqual(
+            about['resume_file_url'], f'http://testserver{self.about.resume_file_url}'
+        )
+    
+    def test_project_returns_absolute_url(self):
+        response = self.client.get(f'/api/projects/{self.project.pk}/')
+        self.assertEqual(
+            response.json()['image_url'], f'http://testserver{self.project.image_url}'
+        )
+    
+    def test_summary_returns_absolute_urls(self):
+        for _ in range(2):
+            summary = self.client.get('/api/summary/').json()
+            self.assertEqual(
+                summary['about']['profile_image_url'],
+                f'http://testserver{self.about.profile_image_url}'
+            )
+            self.assertEqual(
+                summary['featured_projects'][0]['image_url'],
+                f'http://testserver{self.project.image_url}'
+            )
+        
+        # The cached summary keeps site-relative URLs
+        other_host = self.client.get('/api/summary/', HTTP_HOST='localhost').json()
+        self.assertEqual(
+            other_host['about']['profile_image_url'],
+            f'http://localhost{self.about.profile_image_url}'
+        )
+    
+    def test_empty_file_urls_stay_empty(self):
+        About.objects.all().delete()
+        About.objects.create(name='Jane', title='Developer', bio='Bio')
+        about = self.client.get('/api/about/').json()['results'][0]
+        self.assertEqual(about['profile_image_url'], '')
+        self.assertEqual(about['resume_file_url'], '')
+
+
+def content_dir(content):
+    """Get the hash directory expected for file content."""
+    return hashlib.sha1(content).hexdigest()[:16]
+
+
+class HashedUploadTests(PortfolioTestCase):
+    """Uploads are stored under a hash of the content being uploaded."""
+    
+    def make_project(self, **kwargs):
+        return Project(
+            title='Site', description='Description', start_date=date(2024, 1, 1), **kwargs
+        )
+    
+    def test_assigned_file_is_hashed(self):
+        project = self.make_project(image=ContentFile(b'one', name='x.png'))
+        project.save()
+        self.assertEqual(project.image.name, f'projects/{content_dir(b"one")}/x.png')
+        self.assertEqual(project.image_url, f'/media/projects/{content_dir(b"one")}/x.png')
+    
+    def test_field_file_save_on_empty_field(self):
+        project = self.make_project()
+        project.save()
+        project.image.save('a.png', ContentFile(b'hello'))
+        self.assertEqual(project.image.name, f'projects/{content_dir(b"hello")}/a.png')
+        project.refresh_from_db()
+        self.assertEqual(project.image_url, f'/media/projects/{content_dir(b"hello")}/a.png')
+    
+    def test_field_file_save_replaces_hash(self):
+        project = self.make_project(image=ContentFile(b'one', name='x.png'))
+        project.save()
+        project.image.save('y.png', ContentFile(b'two'))
+        self.assertEqual(project.image.name, f'projects/{content_dir(b"two")}/y.png')
+        with project.image.open() as image:
+            self.assertEqual(image.read(), b'two')
+    
+    def test_same_content_gets_same_directory(self):
+        first = self.make_project(image=ContentFile(b'same', name='a.png'))
+        first.save()
+        second = self.make_project(image=ContentFile(b'same', name='b.png'))
+        second.save()
+        self.assertEqual(
+            first.image.name.rsplit('/', 1)[0], second.image.name.rsplit('/', 1)[0]
+        )
+    
+    def test_about_files_are_hashed(self):
+        about = About.objects.create(
+            name='Jane', title='Developer', bio='Bio',
+            resume_file=ContentFile(b'resume', name='cv.pdf')
+        )
+        about.profile_image.save('me.png', ContentFile(b'image'))
+        self.assertEqual(about.resume_file.name, f'resume/{content_dir(b"resume")}/cv.pdf')
+        self.assertEqual(about.profile_image.name, f'profile/{content_dir(b"image")}/me.png')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class StoredURLCommitTests(TransactionTestCase):
+    """Stored file URLs are written before the cache is invalidated."""
+    
+    def test_url_is_stored_when_invalidation_runs(self):
+        seen = []
+        
+        def record_urls():
+            seen.extend(Project.objects.values_list('image_url', flat=True))
+        
+        with mock.patch('portfolio.cache.invalidate_portfolio_cache', side_effect=record_urls):
+            project = Project.objects.create(
+                title='Site', description='Description', start_date=date(2024, 1, 1),
+                image=ContentFile(b'shot', name='shot.png')
+            )
+        self.assertEqual(seen, [project.image_url])
+        self.assertTrue(project.image_url.startswith('/media/'))
+
+
+class ExperienceListTests(PortfolioTestCase):
+    """Experience lists are cursor-paginated by start date."""
+    
+    def test_list_is_ordered_by_start_date(self):
+        Experience.objects.create(
+            company='Old', position='Dev', description='-', start_date=date(2015, 1, 1),
+            is_current=True
+        )
+        Experience.objects.create(
+            company='New', position='Dev', description='-', start_date=date(2020, 1, 1),
+            end_date=date(2021, 1, 1)
+        )
+        response = self.client.get('/api/experience/')
+        companies = [entry['company'] for entry in response.json()['results']]
+        self.assertEqual(companies, ['New', 'Old'])
+        
+        response = self.client.get('/api/experience/?current=true')
+        companies = [entry['company'] for entry in response.json()['results']]
+        self.assertEqual(companies, ['Old'])
+
+
+def create_portfolio():
+    """Create a small portfolio with one row of each kind."""
+    About.objects.create(name='Jane', title='Developer', bio='Bio')
+    Contact.objects.create(email='jane@example.com', location='Nairobi')
+    Skill.objects.create(
+        name='Python', category='programming', proficiency_level=5,
+        years_experience=5, is_featured=True
+    )
+    project = Project.objects.create(
+        title='Site', description='Description', start_date=date(2024, 1, 1),
+        is_featured=True
+    )
+    project.technologies.set([
+        Technology.objects.create(name='Django'),
+        Technology.objects.create(name='React'),
+    ])
+    Experience.objects.create(
+        company='Acme', position='Developer', description='Work',
+        start_date=date(2020, 1, 1), is_current=True, location='Remote'
+    )
+    Education.objects.create(
+        institution='University', degree='BSc', field_of_study='CS',
+        start_date=date(2015, 1, 1), end_date=date(2019, 1, 1), location='Nairobi'
+    )
+    return project
+
+
+class SummaryQueryTests(PortfolioTestCase):
+    """The summary runs a fixed number of queries and none when cached."""
+    
+    def setUp(self):
+        super().setUp()
+        create_portfolio()
+        cache.clear()
+    
+    def test_cold_cache_query_count(self):
+        # About, Contact, skills, projects, project technologies,
+        # experience and education
+        with self.assertNumQueries(7):
+            response = self.client.get('/api/summary/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['featured_projects'][0]['technologies'], ['Django', 'React'])
+    
+    def test_warm_cache_runs_no_queries(self):
+        self.client.get('/api/summary/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/summary/')
+        self.assertEqual(response.status_code, 200)
+    
+    def test_query_count_does_not_grow_with_rows(self):
+        for index in range(5):
+            project = Project.objects.create(
+                title=f'Project {index}', description='Description',
+                start_date=date(2023, 1, index + 1), is_featured=True
+            )
+            project.technologies.add(Technology.objects.get(name='Django'))
+        cache.clear()
+        with self.assertNumQueries(7):
+            self.client.get('/api/summary/')
+
+
+class CacheInvalidationTests(PortfolioTestCase):
+    """Every write path refreshes the summary, stats and cached counts."""
+    
+    def setUp(self):
+        super().setUp()
+        self.project = create_portfolio()
+        self.admin = APIClient()
+        self.admin.force_login(get_user_model().objects.create_superuser(
+            'admin', 'admin@example.com', 'password'
+        ))
+    
+    def get_etag(self):
+        response = self.client.get('/api/summary/')
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+    
+    def assert_summary_changed(self, etag):
+        response = self.client.get('/api/summary/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+    
+    def admin_action(self, model, action, obj):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.admin.post(f'/admin/portfolio/{model}/', {
+                'action': action, '_selected_action': [obj.pk],
+            })
+        self.assertEqual(response.status_code, 302)
+    
+    def test_matching_etag_gets_not_modified(self):
+        etag = self.get_etag()
+        response = self.client.get('/api/summary/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+    
+    def test_unchanged_last_modified_gets_not_modified(self):
+        last_modified = self.client.get('/api/summary/')['Last-Modified']
+        response = self.client.get('/api/summary/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+    
+    def test_etag_is_shared_by_separate_caches(self):
+        etag = self.get_etag()
+        # Another process builds the summary in its own, empty cache
+        cache.clear()
+        response = self.client.get('/api/summary/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+    
+    def test_expired_summary_gets_new_etag(self):
+        etag = self.get_etag()
+        # A process that missed the invalidation rebuilds once its entry expires
+        Skill.objects.update(name='Go')
+        cache.delete(SUMMARY_CACHE_KEY)
+        self.assert_summary_changed(etag)
+        summary = self.client.get('/api/summary/').json()
+        self.assertEqual(summary['featured_skills'][0]['name'], 'Go')
+    
+    def test_save_changes_etag_stats_and_counts(self):
+        etag = self.get_etag()
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['total_skills'], 1)
+        self.assertEqual(self.client.get('/api/skills/').json()['count'], 1)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(
+                name='Go', category='programming', proficiency_level=3,
+                years_experience=1, is_featured=True
+            )
+        
+        self.assert_summary_changed(etag)
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['total_skills'], 2)
+        self.assertEqual(self.client.get('/api/skills/').json()['count'], 2)
+    
+    def test_delete_changes_etag_stats_and_counts(self):
+        etag = self.get_etag()
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['total_projects'], 1)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.delete()
+        
+        self.assert_summary_changed(etag)
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['total_projects'], 0)
+    
+    def test_m2m_change_changes_etag_and_counts(self):
+        tagged = Project.objects.filter(technologies__name='Vue')
+        self.assertEqual(CachingPaginator(tagged, 20).count, 0)
+        etag = self.get_etag()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.technologies.add(Technology.objects.create(name='Vue'))
+        
+        self.assert_summary_changed(etag)
+        summary = self.client.get('/api/summary/').json()
+        self.assertIn('Vue', summary['featured_projects'][0]['technologies'])
+        self.assertEqual(CachingPaginator(tagged, 20).count, 1)
+    
+    def test_admin_toggle_changes_etag_stats_and_counts(self):
+        etag = self.get_etag()
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['featured_skills'], 1)
+        self.assertEqual(self.client.get('/api/skills/?featured=true').json()['count'], 1)
+        
+        self.admin_action('skill', 'toggle_featured', Skill.objects.get())
+        
+        self.assert_summary_changed(etag)
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['featured_skills'], 0)
+        self.assertEqual(self.client.get('/api/skills/?featured=true').json()['count'], 0)
+        self.assertEqual(self.client.get('/api/summary/').json()['featured_skills'], [])
+    
+    def test_admin_toggle_changes_project_stats(self):
+        etag = self.get_etag()
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['total_projects'], 1)
+        
+        self.admin_action('project', 'toggle_published', self.project)
+        
+        self.assert_summary_changed(etag)
+        self.assertEqual(self.client.get('/api/summary/stats/').json()['total_projects'], 0)
+    
+    def test_invalidation_waits_for_commit(self):
+        summary = self.client.get('/api/summary/').json()
+        self.assertEqual(len(summary['featured_skills']), 1)
+        
+        with self.captureOnCommitCallbacks() as callbacks:
+            Skill.objects.create(
+                name='Go', category='programming', proficiency_level=3,
+                years_experience=1, is_featured=True
+            )
+            About.objects.update(name='Changed')
+            About.objects.get().save()
+            # Until the write commits, readers keep the cached responses
+            summary = self.client.get('/api/summary/').json()
+            self.assertEqual(len(summary['featured_skills']), 1)
+            self.assertEqual(summary['about']['name'], 'Jane')
+        
+        for callback in callbacks:
+            callback()
+        summary = self.client.get('/api/summary/').json()
+        self.assertEqual(len(summary['featured_skills']), 2)
+        self.assertEqual(summary['about']['name'], 'Changed')
+
+
+class AdminChangelistCountTests(PortfolioTestCase):
+    """Admin changelists reuse cached row counts."""
+    
+    def setUp(self):
+        super().setUp()
+        create_portfolio()
+        self.client.force_login(get_user_model().objects.create_superuser(
+            'admin', 'admin@example.com', 'password'
+        ))
+    
+    def test_second_load_runs_no_count(self):
+        for model in ('skill', 'project', 'experience', 'education'):
+            url = f'/admin/portfolio/{model}/'
+            self.assertEqual(self.client.get(url).status_code, 200)
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(url).status_code, 200)
+            counts = [query['sql'] for query in queries if 'COUNT(' in query['sql']]
+            self.assertEqual(counts, [], model)
+
+
+class ProjectAdminSearchTests(PortfolioTestCase):
+    """Admin project search also matches technology tags."""
+    
+    def setUp(self):
+        super().setUp()
+        self.project = create_portfolio()
+        Project.objects.create(
+            title='Other', description='Description', start_date=date(2024, 1, 1)
+        )
+        self.client.force_login(get_user_model().objects.create_superuser(
+            'admin', 'admin@example.com', 'password'
+        ))
+    
+    def search(self, term):
+        response = self.client.get('/admin/portfolio/project/', {'q': term})
+        return [project.pk for project in response.context['cl'].result_list]
+    
+    def test_search_by_technology(self):
+        self.assertEqual(self.search('React'), [self.project.pk])
+    
+    def test_full_text_search_includes_technology_tags(self):
+        # Stand in for the PostgreSQL search vector with one that never matches
+        with mock.patch('portfolio.admin.full_text_search_supported', return_value=True), \
+                mock.patch('portfolio.admin.annotate_search_vector',
+                           lambda queryset, fields: queryset.annotate(search_vector=Value(''))), \
+                mock.patch('portfolio.admin.search_query', return_value='-'):
+            self.assertEqual(self.search('React'), [self.project.pk])
+            self.assertEqual(self.search('react'), [])
+            self.assertEqual(self.search('Vue'), [])
+
+
+class ProjectTechnologyWriteTests(PortfolioTestCase):
+    """Technologies submitted by name are only created when a project is saved."""
+    
+    def project_data(self, **overrides):
+        data = {
+            'title': 'Site', 'description': 'Description', 'short_description': 'Short',
+            'start_date': '2024-01-01', 'technologies': ['Django', ' Vue '],
+        }
+        data.update(overrides)
+        return data
+    
+    def test_create_links_new_and_existing_technologies(self):
+        django = Technology.objects.create(name='Django')
+        response = self.client.post('/api/projects/', self.project_data(), format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(sorted(response.json()['technologies']), ['Django', 'Vue'])
+        self.assertEqual(Technology.objects.count(), 2)
+        self.assertIn(django, Project.objects.get().technologies.all())
+    
+    def test_invalid_project_creates_no_technologies(self):
+        response = self.client.post(
+            '/api/projects/', self.project_data(end_date='2023-01-01'), format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Technology.objects.exists())
+    
+    def test_partial_update_sets_technologies(self):
+        project = create_portfolio()
+        response = self.client.patch(
+            f'/api/projects/{project.pk}/', {'technologies': ['Vue']}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(list(project.technologies.values_list('name', flat=True)), ['Vue'])
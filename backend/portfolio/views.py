@@ -5,20 +5,112 @@ This module contains API views for handling portfolio data including
 CRUD operations and custom endpoints for portfolio summary.
 """
 
-from rest_framework import viewsets, status
+import hashlib
+from calendar import timegm
+
+import orjson
+
+from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-from django.db.models import Q
-from .models import Skill, Project, Experience, Education, Contact, About
+from rest_framework.permissions import AllowAny, SAFE_METHODS
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.cache import cache_control
+from django.db.models import Count, Q
+from django.utils import timezone
+from .cache import (
+    SUMMARY_CACHE_KEY, SUMMARY_CACHE_TIMEOUT, STATS_CACHE_KEY, STATS_CACHE_TIMEOUT
+)
+from .models import Skill, Technology, Project, Experience, Education, Contact, About
+from .pagination import StartDateCursorPagination
+from .renderers import ORJSONRenderer
+from .search import (
+    PROJECT_SEARCH_FIELDS, annotate_search_vector, full_text_search_supported, search_query,
+    tagged_project_ids
+)
 from .serializers import (
-    SkillSerializer, ProjectSerializer, ExperienceSerializer,
-    EducationSerializer, ContactSerializer, AboutSerializer,
-    PortfolioSummarySerializer
+    SkillReadSerializer, SkillWriteSerializer, ProjectSerializer,
+    ProjectListSerializer, ExperienceSerializer, ExperienceListSerializer,
+    EducationSerializer, ContactSerializer, AboutSerializer
+)
+
+# Columns read for each section of the portfolio summary
+SUMMARY_SKILL_FIELDS = (
+    'id', 'name', 'category', 'proficiency_level', 'years_experience',
+    'is_featured', 'created_at', 'updated_at'
+)
+SUMMARY_PROJECT_FIELDS = (
+    'id', 'title', 'description', 'short_description', 'github_url',
+    'live_url', 'image_url', 'is_featured', 'is_published', 'start_date',
+    'end_date', 'duration_months', 'created_at', 'updated_at'
+)
+SUMMARY_EXPERIENCE_FIELDS = (
+    'id', 'company', 'position', 'description', 'start_date', 'end_date',
+    'is_current', 'location', 'company_url', 'created_at', 'updated_at'
 )
+SUMMARY_EDUCATION_FIELDS = (
+    'id', 'institution', 'degree', 'field_of_study', 'start_date',
+    'end_date', 'is_current', 'gpa', 'location', 'created_at', 'updated_at'
+)
+
+# Stateless serializers reused to render the summary's singleton sections
+_ABOUT_SERIALIZER = AboutSerializer()
+_CONTACT_SERIALIZER = ContactSerializer()
 
+# Skill categories never change at runtime, so the response is rendered once
+_SKILL_CATEGORIES = [
+    {'value': value, 'label': label} for value, label in Skill.CATEGORY_CHOICES
+]
+_SKILL_CATEGORIES_JSON = ORJSONRenderer().render(_SKILL_CATEGORIES)
 
-class SkillViewSet(viewsets.ModelViewSet):
+# Accepted spellings of boolean query parameters
+_BOOL_MAP = {'true': True, '1': True, 'false': False, '0': False}
+
+
+def _boolean_filters(query_params, fields):
+    """Map boolean query parameters to model field filters."""
+    filters = {}
+    for param, field in fields.items():
+        value = _BOOL_MAP.get(query_params.get(param, '').lower())
+        if value is not None:
+            filters[field] = value
+    return filters
+
+
+def _stats_response(stats):
+    """Render portfolio stats as compact JSON."""
+    return HttpResponse(orjson.dumps(stats), content_type='application/json')
+
+
+def _stream_json_list(items):
+    """Yield a JSON array one encoded item at a time."""
+    yield b'['
+    for index, item in enumerate(items):
+        if index:
+            yield b','
+        yield orjson.dumps(item)
+    yield b']'
+
+
+class EagerLoadingViewSetMixin:
+    """
+    Mixin for model viewsets that eager-loads serializer relations.
+    
+    The base queryset is passed through the serializer's
+    prefetch_queryset, so each viewset loads exactly the relations
+    its serializer reads.
+    """
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        return self.get_serializer_class().prefetch_queryset(queryset)
+
+
+class SkillViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing skills.
     
@@ -27,33 +119,33 @@ class SkillViewSet(viewsets.ModelViewSet):
     """
     
     queryset = Skill.objects.all()
-    serializer_class = SkillSerializer
+    serializer_class = SkillWriteSerializer
     permission_classes = [AllowAny]
     
     def get_queryset(self):
         """Filter skills based on query parameters."""
-        queryset = Skill.objects.all()
+        queryset = super().get_queryset()
+        filters = _boolean_filters(self.request.query_params, {'featured': 'is_featured'})
         category = self.request.query_params.get('category', None)
-        featured = self.request.query_params.get('featured', None)
         
         if category:
-            queryset = queryset.filter(category=category)
-        
-        if featured is not None:
-            featured_bool = featured.lower() == 'true'
-            queryset = queryset.filter(is_featured=featured_bool)
+            filters['category'] = category
         
-        return queryset
+        return queryset.filter(**filters)
+    
+    def get_serializer_class(self):
+        """Use the read-only serializer for safe requests."""
+        if self.request.method in SAFE_METHODS:
+            return SkillReadSerializer
+        return super().get_serializer_class()
     
     @action(detail=False, methods=['get'])
     def categories(self, request):
         """Get list of available skill categories."""
-        categories = [{'value': choice[0], 'label': choice[1]} 
-                     for choice in Skill.CATEGORY_CHOICES]
-        return Response(categories)
+        return HttpResponse(_SKILL_CATEGORIES_JSON, content_type='application/json')
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing projects.
     
@@ -64,70 +156,83 @@ class ProjectViewSet(viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
     permission_classes = [AllowAny]
+    pagination_class = StartDateCursorPagination
     
     def get_queryset(self):
         """Filter projects based on query parameters."""
-        queryset = Project.objects.all()
-        featured = self.request.query_params.get('featured', None)
-        published = self.request.query_params.get('published', None)
+        filters = _boolean_filters(self.request.query_params, {
+            'featured': 'is_featured',
+            'published': 'is_published',
+        })
+        queryset = super().get_queryset().filter(**filters)
         technology = self.request.query_params.get('technology', None)
         
-        if featured is not None:
-            featured_bool = featured.lower() == 'true'
-            queryset = queryset.filter(is_featured=featured_bool)
-        
-        if published is not None:
-            published_bool = published.lower() == 'true'
-            queryset = queryset.filter(is_published=published_bool)
-        
         if technology:
-            queryset = queryset.filter(
-                Q(technologies__icontains=technology) |
-                Q(title__icontains=technology) |
-                Q(description__icontains=technology)
-            )
+            if full_text_search_supported():
+                queryset = annotate_search_vector(queryset, PROJECT_SEARCH_FIELDS)
+                text_match = Q(search_vector=search_query(technology))
+            else:
+                text_match = (
+                    Q(title__icontains=technology) |
+                    Q(description__icontains=technology)
+                )
+            
+            queryset = queryset.filter(Q(id__in=tagged_project_ids(technology)) | text_match)
+        
+        if self.action == 'list':
+            queryset = queryset.defer('description', 'image')
         
         return queryset
     
+    def get_serializer_class(self):
+        """Use the lightweight serializer for list responses."""
+        if self.action == 'list':
+            return ProjectListSerializer
+        return super().get_serializer_class()
+    
     @action(detail=False, methods=['get'])
     def technologies(self, request):
         """Get list of all technologies used in projects."""
-        projects = Project.objects.filter(is_published=True)
-        technologies = set()
-        
-        for project in projects:
-            if project.technologies:
-                tech_list = [tech.strip() for tech in project.technologies.split(',')]
-                technologies.update(tech_list)
-        
-        return Response(sorted(list(technologies)))
+        technologies = Technology.objects.filter(
+            projects__is_published=True
+        ).order_by('name').values_list('name', flat=True).distinct()
+        return StreamingHttpResponse(
+            _stream_json_list(technologies.iterator()), content_type='application/json'
+        )
 
 
-class ExperienceViewSet(viewsets.ModelViewSet):
+class ExperienceViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing work experience.
     
     Provides CRUD operations for experience with filtering
-    by current status and date range.
+    by current status and date range. Lists are ordered by most
+    recent start date; use ?current=true to list current positions.
     """
     
     queryset = Experience.objects.all()
     serializer_class = ExperienceSerializer
     permission_classes = [AllowAny]
+    pagination_class = StartDateCursorPagination
     
     def get_queryset(self):
         """Filter experience based on query parameters."""
-        queryset = Experience.objects.all()
-        current = self.request.query_params.get('current', None)
+        filters = _boolean_filters(self.request.query_params, {'current': 'is_current'})
+        queryset = super().get_queryset().filter(**filters)
         
-        if current is not None:
-            current_bool = current.lower() == 'true'
-            queryset = queryset.filter(is_current=current_bool)
+        if self.action == 'list':
+            queryset = queryset.defer('description')
         
         return queryset
+    
+    def get_serializer_class(self):
+        """Use the lightweight serializer for list responses."""
+        if self.action == 'list':
+            return ExperienceListSerializer
+        return super().get_serializer_class()
 
 
-class EducationViewSet(viewsets.ModelViewSet):
+class EducationViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing education.
     
@@ -138,20 +243,15 @@ class EducationViewSet(viewsets.ModelViewSet):
     queryset = Education.objects.all()
     serializer_class = EducationSerializer
     permission_classes = [AllowAny]
+    pagination_class = StartDateCursorPagination
     
     def get_queryset(self):
         """Filter education based on query parameters."""
-        queryset = Education.objects.all()
-        current = self.request.query_params.get('current', None)
-        
-        if current is not None:
-            current_bool = current.lower() == 'true'
-            queryset = queryset.filter(is_current=current_bool)
-        
-        return queryset
+        filters = _boolean_filters(self.request.query_params, {'current': 'is_current'})
+        return super().get_queryset().filter(**filters)
 
 
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing contact information.
     
@@ -163,7 +263,7 @@ class ContactViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
 
 
-class AboutViewSet(viewsets.ModelViewSet):
+class AboutViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing about information.
     
@@ -185,78 +285,168 @@ class PortfolioSummaryViewSet(viewsets.ViewSet):
     
     permission_classes = [AllowAny]
     
+    @method_decorator(cache_control(no_cache=True))
     def list(self, request):
         """
         Get portfolio summary data.
         
         Returns combined data from all portfolio models
-        for the main portfolio page.
+        for the main portfolio page. List sections are built from
+        ``values()`` rows rather than nested model serializers. The
+        response is cached until any portfolio model is saved or deleted.
+        Clients revalidate with ETag/Last-Modified and get a 304 when
+        nothing has changed.
         """
-        try:
-            # Get the most recent about and contact information
-            about = About.objects.first()
-            contact = Contact.objects.first()
-            
-            # Get featured skills (limit to 8)
-            featured_skills = Skill.objects.filter(is_featured=True)[:8]
-            
-            # Get featured projects (limit to 6)
-            featured_projects = Project.objects.filter(
-                is_featured=True, 
-                is_published=True
-            )[:6]
-            
-            # Get recent experience (limit to 3)
-            recent_experience = Experience.objects.all()[:3]
-            
-            # Get all education
-            education = Education.objects.all()
-            
-            # Prepare summary data
-            summary_data = {
-                'about': about,
-                'contact': contact,
-                'featured_skills': featured_skills,
-                'featured_projects': featured_projects,
-                'recent_experience': recent_experience,
-                'education': education
+        entry = self._cached_summary()
+        response = get_conditional_response(
+            request, etag=entry['etag'], last_modified=entry['last_modified']
+        )
+        if response is None:
+            response = Response(self._with_absolute_media_urls(request, entry['data']))
+        response['ETag'] = entry['etag']
+        response['Last-Modified'] = http_date(entry['last_modified'])
+        return response
+    
+    def _cached_summary(self):
+        """
+        Get the cached summary with its validators, building it on a miss.
+        
+        The ETag is a hash of the summary itself and is cached with it,
+        so it expires with the data and processes with separate caches
+        agree on it.
+        """
+        entry = cache.get(SUMMARY_CACHE_KEY)
+        if entry is None:
+            summary_data = self._build_summary()
+            entry = {
+                'data': summary_data,
+                'etag': quote_etag(
+                    hashlib.md5(orjson.dumps(summary_data, default=str)).hexdigest()
+                ),
+                'last_modified': timegm(timezone.now().utctimetuple()),
             }
-            
-            serializer = PortfolioSummarySerializer(summary_data)
-            return Response(serializer.data)
-            
-        except Exception as e:
-            return Response(
-                {'error': f'Failed to retrieve portfolio summary: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            cache.set(SUMMARY_CACHE_KEY, entry, SUMMARY_CACHE_TIMEOUT)
+        return entry
+    
+    def _build_summary(self):
+        """Build the summary data stored in the cache."""
+        # Get the most recent about and contact information
+        about = About.get_cached()
+        contact = Contact.get_cached()
+        
+        return {
+            'about': _ABOUT_SERIALIZER.to_representation(about) if about else None,
+            'contact': _CONTACT_SERIALIZER.to_representation(contact) if contact else None,
+            'featured_skills': self._featured_skills(),
+            'featured_projects': self._featured_projects(),
+            'recent_experience': list(
+                Experience.objects.values(*SUMMARY_EXPERIENCE_FIELDS)[:3]
+            ),
+            'education': list(Education.objects.values(*SUMMARY_EDUCATION_FIELDS)),
+        }
+    
+    def _with_absolute_media_urls(self, request, summary_data):
+        """
+        Copy the summary with stored media URLs made absolute.
+        
+        The cached summary keeps site-relative URLs so it does not depend
+        on the host of the request that built it.
+        """
+        def absolute(url):
+            return request.build_absolute_uri(url) if url else url
+        
+        summary_data = dict(summary_data)
+        about = summary_data['about']
+        if about is not None:
+            summary_data['about'] = {
+                **about,
+                'profile_image_url': absolute(about['profile_image_url']),
+                'resume_file_url': absolute(about['resume_file_url']),
+            }
+        summary_data['featured_projects'] = [
+            {**project, 'image_url': absolute(project['image_url'])}
+            for project in summary_data['featured_projects']
+        ]
+        return summary_data
+    
+    def _featured_skills(self):
+        """Get featured skills (limit to 8) as plain dicts."""
+        skills = list(
+            Skill.objects.filter(is_featured=True).values(*SUMMARY_SKILL_FIELDS)[:8]
+        )
+        for skill in skills:
+            skill['category_display'] = Skill.CATEGORY_LABELS.get(
+                skill['category'], skill['category']
             )
+        return skills
+    
+    def _featured_projects(self):
+        """Get featured projects (limit to 6) as plain dicts."""
+        projects = list(
+            Project.objects.filter(
+                is_featured=True,
+                is_published=True
+            ).values(*SUMMARY_PROJECT_FIELDS)[:6]
+        )
+        
+        # Fetch technology names for all projects in one query
+        technologies = {project['id']: [] for project in projects}
+        project_technologies = Project.technologies.through.objects.filter(
+            project_id__in=list(technologies)
+        ).order_by('technology__name').values_list('project_id', 'technology__name')
+        for project_id, name in project_technologies:
+            technologies[project_id].append(name)
+        
+        today = timezone.now().date()
+        for project in projects:
+            duration = project.pop('duration_months')
+            if duration is None:
+                duration = Project.months_between(project['start_date'], today)
+            project['duration'] = duration
+            project['technologies'] = technologies[project['id']]
+        return projects
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """
         Get portfolio statistics.
         
-        Returns counts and metrics for portfolio data.
+        Returns counts and metrics for portfolio data. The response is
+        cached until any portfolio model is saved or deleted, and is a
+        flat dict of integers rendered directly with orjson.
         """
-        try:
-            stats = {
-                'total_projects': Project.objects.filter(is_published=True).count(),
-                'featured_projects': Project.objects.filter(
-                    is_featured=True, 
-                    is_published=True
-                ).count(),
-                'total_skills': Skill.objects.count(),
-                'featured_skills': Skill.objects.filter(is_featured=True).count(),
-                'total_experience': Experience.objects.count(),
-                'current_experience': Experience.objects.filter(is_current=True).count(),
-                'total_education': Education.objects.count(),
-                'current_education': Education.objects.filter(is_current=True).count(),
-            }
-            
-            return Response(stats)
-            
-        except Exception as e:
-            return Response(
-                {'error': f'Failed to retrieve portfolio stats: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+        cached_stats = cache.get(STATS_CACHE_KEY)
+        if cached_stats is not None:
+            return _stats_response(cached_stats)
+        
+        # One conditional aggregate per table instead of one COUNT per metric
+        projects = Project.objects.aggregate(
+            total=Count('id', filter=Q(is_published=True)),
+            featured=Count('id', filter=Q(is_featured=True, is_published=True)),
+        )
+        skills = Skill.objects.aggregate(
+            total=Count('id'),
+            featured=Count('id', filter=Q(is_featured=True)),
+        )
+        experience = Experience.objects.aggregate(
+            total=Count('id'),
+            current=Count('id', filter=Q(is_current=True)),
+        )
+        education = Education.objects.aggregate(
+            total=Count('id'),
+            current=Count('id', filter=Q(is_current=True)),
+        )
+        
+        stats = {
+            'total_projects': projects['total'],
+            'featured_projects': projects['featured'],
+            'total_skills': skills['total'],
+            'featured_skills': skills['featured'],
+            'total_experience': experience['total'],
+            'current_experience': experience['current'],
+            'total_education': education['total'],
+            'current_education': education['current'],
+        }
+        
+        cache.set(STATS_CACHE_KEY, stats, STATS_CACHE_TIMEOUT)
+        return _stats_response(stats)
\ No newline at end of file
@@ -121,9 +121,9 @@ const About: React.FC<AboutProps> = ({ className = '', onContactClick }) => {
             {/* Profile Image */}
             <motion.div className="about__image-container" variants={imageVariants}>
               <div className="about__image-wrapper">
-                {about?.profile_image ? (
+                {about?.profile_image_url ? (
                   <img
-                    src={about.profile_image}
+                    src={about.profile_image_url}
                     alt={about.name || 'Profile'}
                     className="about__image"
                   />
@@ -203,7 +203,7 @@ const About: React.FC<AboutProps> = ({ className = '', onContactClick }) => {
                 </motion.button>
 
                 <motion.a
-                  href={about?.resume_file || '#'}
+                  href={about?.resume_file_url || '#'}
                   className="about__btn about__btn--secondary"
                   download
                   whileHover={{ scale: 1.05, y: -2 }}
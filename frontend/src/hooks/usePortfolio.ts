@@ -8,8 +8,8 @@
 import { useState, useEffect, useCallback } from 'react';
 import {
   Skill,
-  Project,
-  Experience,
+  ProjectListItem,
+  ExperienceListItem,
   Education,
   Contact,
   About,
@@ -67,7 +67,7 @@ export const useSkills = (filters?: SkillFilters) => {
 
 // Hook for fetching projects
 export const useProjects = (filters?: ProjectFilters) => {
-  const [state, setState] = useState<UseApiState<Project[]>>({
+  const [state, setState] = useState<UseApiState<ProjectListItem[]>>({
     data: null,
     loading: true,
     error: null,
@@ -96,7 +96,7 @@ export const useProjects = (filters?: ProjectFilters) => {
 
 // Hook for fetching experience
 export const useExperience = (current?: boolean) => {
-  const [state, setState] = useState<UseApiState<Experience[]>>({
+  const [state, setState] = useState<UseApiState<ExperienceListItem[]>>({
     data: null,
     loading: true,
     error: null,
@@ -9,7 +9,9 @@ import axios, { AxiosInstance, AxiosResponse } from 'axios';
 import {
   Skill,
   Project,
+  ProjectListItem,
   Experience,
+  ExperienceListItem,
   Education,
   Contact,
   About,
@@ -102,7 +104,7 @@ export const projectsApi = {
   /**
    * Get all projects with optional filtering
    */
-  getAll: async (filters?: ProjectFilters): Promise<Project[]> => {
+  getAll: async (filters?: ProjectFilters): Promise<ProjectListItem[]> => {
     const params = new URLSearchParams();
     
     if (filters?.featured !== undefined) {
@@ -117,8 +119,8 @@ export const projectsApi = {
       params.append('technology', filters.technology);
     }
     
-    const response = await apiClient.get<Project[]>(`/projects/?${params.toString()}`);
-    return response.data;
+    const response = await apiClient.get<ApiResponse<ProjectListItem>>(`/projects/?${params.toString()}`);
+    return response.data.results;
   },
 
   /**
@@ -143,17 +145,21 @@ export const projectsApi = {
  */
 export const experienceApi = {
   /**
-   * Get all work experience
+   * Get all work experience, current positions first
    */
-  getAll: async (current?: boolean): Promise<Experience[]> => {
+  getAll: async (current?: boolean): Promise<ExperienceListItem[]> => {
     const params = new URLSearchParams();
     
     if (current !== undefined) {
       params.append('current', current.toString());
     }
     
-    const response = await apiClient.get<Experience[]>(`/experience/?${params.toString()}`);
-    return response.data;
+    // The API pages experience by most recent start date; current
+    // positions are moved to the front here (the sort is stable)
+    const response = await apiClient.get<ApiResponse<ExperienceListItem>>(`/experience/?${params.toString()}`);
+    return [...response.data.results].sort(
+      (a, b) => Number(b.is_current) - Number(a.is_current)
+    );
   },
 
   /**
@@ -170,7 +176,7 @@ export const experienceApi = {
  */
 export const educationApi = {
   /**
-   * Get all education records
+   * Get all education records, current enrollments first
    */
   getAll: async (current?: boolean): Promise<Education[]> => {
     const params = new URLSearchParams();
@@ -179,8 +185,12 @@ export const educationApi = {
       params.append('current', current.toString());
     }
     
-    const response = await apiClient.get<Education[]>(`/education/?${params.toString()}`);
-    return response.data;
+    // Education is paged by most recent start date like experience;
+    // current enrollments are moved to the front here (the sort is stable)
+    const response = await apiClient.get<ApiResponse<Education>>(`/education/?${params.toString()}`);
+    return [...response.data.results].sort(
+      (a, b) => Number(b.is_current) - Number(a.is_current)
+    );
   },
 
   /**
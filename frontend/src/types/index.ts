@@ -27,11 +27,10 @@ export interface Project extends BaseModel {
   title: string;
   description: string;
   short_description: string;
-  technologies: string;
-  technologies_list: string[];
+  technologies: string[];
   github_url?: string;
   live_url?: string;
-  image?: string;
+  image_url?: string;
   is_featured: boolean;
   is_published: boolean;
   start_date: string;
@@ -39,6 +38,9 @@ export interface Project extends BaseModel {
   duration: number; // in months
 }
 
+// Project list responses omit the full description
+export type ProjectListItem = Omit<Project, 'description'>;
+
 // Experience related interfaces
 export interface Experience extends BaseModel {
   company: string;
@@ -51,6 +53,9 @@ export interface Experience extends BaseModel {
   company_url?: string;
 }
 
+// Experience list responses omit the full description
+export type ExperienceListItem = Omit<Experience, 'description'>;
+
 // Education related interfaces
 export interface Education extends BaseModel {
   institution: string;
@@ -64,7 +69,7 @@ export interface Education extends BaseModel {
 }
 
 // Contact related interfaces
-export interface Contact extends BaseModel {
+export interface Contact extends Omit<BaseModel, 'updated_at'> {
   email: string;
   phone?: string;
   location: string;
@@ -76,12 +81,12 @@ export interface Contact extends BaseModel {
 }
 
 // About related interfaces
-export interface About extends BaseModel {
+export interface About extends Omit<BaseModel, 'updated_at'> {
   name: string;
   title: string;
   bio: string;
-  profile_image?: string;
-  resume_file?: string;
+  profile_image_url?: string;
+  resume_file_url?: string;
 }
 
 // Portfolio summary interface
@@ -108,7 +113,7 @@ export interface PortfolioStats {
 
 // API response interfaces
 export interface ApiResponse<T> {
-  count: number;
+  count?: number;
   next?: string;
   previous?: string;
   results: T[];